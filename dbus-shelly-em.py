@@ -5,13 +5,25 @@ import platform
 import logging
 import sys
 import os
+import random
+import threading
 import time
+import zlib
+from contextlib import nullcontext
 from datetime import datetime
+from functools import lru_cache
+from typing import Optional
 import requests  # HTTP GET
+from requests.adapters import HTTPAdapter
 import configparser  # INI config
 from gi.repository import GLib as gobject
 from multiprocessing import Process
 
+try:
+    from orjson import loads as json_loads  # faster JSON decoding, if installed
+except ImportError:
+    from json import loads as json_loads
+
 # Victron libs (velib_python)
 # Use absolute path;
 VIC_TRON_PATH = "/opt/victronenergy/dbus-systemcalc-py/ext/velib_python"
@@ -31,7 +43,68 @@ DEVICE_TYPE_ET340 = 345
 
 # Networking
 REQUEST_TIMEOUT_SECONDS = 1
-REFRESH_INTERVAL_MS = 500
+# Default poll interval; the Shelly EM refreshes its readings about once a second.
+# Overridable via [global] RefreshIntervalMs, but not below the minimum.
+REFRESH_INTERVAL_MS = 1000
+MIN_REFRESH_INTERVAL_MS = 250
+# Exponential backoff before retrying a failed poll: ~1 s, 2 s, 4 s ... (jittered, capped)
+BACKOFF_MAX_SECONDS = 30
+# Wait between /shelly serial lookups while they keep failing
+SERIAL_RETRY_SECONDS = 60
+# Consecutive failed polls before power values are zeroed; a single transient
+# failure is only retried
+FAILURES_BEFORE_ZEROING = 2
+# Delay between spawning device processes, so their startup requests don't pile up
+PROCESS_START_STAGGER_SECONDS = 0.2
+
+# Shelly reports energy counters in Wh; D-Bus expects kWh
+WH_TO_KWH = 1e-3
+
+# Changes of instantaneous readings (W, V, A) at or below this are not
+# republished on D-Bus; energy counters are compared exactly
+VALUE_EPSILON = 1e-3
+
+
+# D-Bus text formatters (gettextcallback receives path and value)
+def _kwh(path, value):
+    return f"{value:.2f} kWh"
+
+
+def _a(path, value):
+    return f"{value:.1f} A"
+
+
+def _w(path, value):
+    return f"{value:.1f} W"
+
+
+def _v(path, value):
+    return f"{value:.1f} V"
+
+
+# Published measurement paths: (path, initial value, text formatter)
+PATHS = (
+    ("/Ac/Energy/Forward", 0, _kwh),
+    ("/Ac/Energy/Reverse", 0, _kwh),
+    ("/Ac/Power", 0, _w),
+    ("/Ac/Current", 0, _a),
+    ("/Ac/Voltage", 0, _v),
+    ("/Ac/L1/Voltage", 0, _v),
+    ("/Ac/L1/Current", 0, _a),
+    ("/Ac/L1/Power", 0, _w),
+)
+
+
+# D-Bus paths written by _apply_sample, one group per value in the order of its
+# arguments, with the change threshold for that value. On this single-phase
+# meter L1 mirrors the totals, so each pair shares one change check.
+SAMPLE_PATHS = (
+    (("/Ac/Power", "/Ac/L1/Power"), VALUE_EPSILON),
+    (("/Ac/Voltage", "/Ac/L1/Voltage"), VALUE_EPSILON),
+    (("/Ac/Current", "/Ac/L1/Current"), VALUE_EPSILON),
+    (("/Ac/Energy/Forward",), 0.0),
+    (("/Ac/Energy/Reverse",), 0.0),
+)
 
 
 class DeviceAdapter(logging.LoggerAdapter):
@@ -83,8 +156,18 @@ class DbusShellyEmService:
             else PRODUCT_ID_GRID if role == "grid" else 0xFFFF  # generic EV charger
         )
 
-        # Reuse one HTTP session for all requests
+        # Reuse one HTTP session for all requests; a single pooled keep-alive
+        # connection is enough since each process polls exactly one Shelly
         self.session = requests.Session()
+        self.session.mount(
+            "http://",
+            HTTPAdapter(pool_connections=1, pool_maxsize=1, pool_block=True),
+        )
+        self.session.headers.update(
+            {"Accept": "application/json", "Connection": "keep-alive"}
+        )
+        # Skip per-request proxy/netrc environment lookups; the Shelly is on the LAN
+        self.session.trust_env = False
         # timeouts are a (connect, read) tuple; see _getShellyData
         self._request_timeout = REQUEST_TIMEOUT_SECONDS
 
@@ -93,6 +176,8 @@ class DbusShellyEmService:
         # Device-scoped logger with a readable prefix (dev name, role, instance, host)
         tag = f"{dev_name}:{role}:{deviceinstance}@{host or '-'}"
         self.log = DeviceAdapter(logging.getLogger(__name__), {"prefix": tag})
+        # The level is fixed for the process lifetime; checked once per sample in _update
+        self._debug_enabled = self.log.isEnabledFor(logging.DEBUG)
         if not host:
             self.log.critical("[device:*] section requires Host")
             sys.exit(1)
@@ -100,9 +185,15 @@ class DbusShellyEmService:
         username = self.device_cfg.get("Username", "").strip()
         password = self.device_cfg.get("Password", "")
         self.auth = (username, password) if username else None
+        self.session.auth = self.auth
 
         # Read selected channel (0 or 1) for Shelly EM
         self.channel_idx = self._getSelectedChannel()
+        # /emeter/<ch> only carries the meter fields, unlike the much larger /status
+        self._emeter_url = f"{self.shelly_base}/emeter/{self.channel_idx}"
+        self._info_url = f"{self.shelly_base}/shelly"
+        self._sign_of_life_minutes = self._getSignOfLifeInterval()
+        self._refresh_ms = self._getRefreshInterval()
 
         self._dbusservice = VeDbusService(f"{servicename}.http_{deviceinstance:02d}")
         self._paths = paths
@@ -129,26 +220,46 @@ class DbusShellyEmService:
         self._dbusservice.add_path("/Connected", 1)
         self._dbusservice.add_path("/Role", role)
         self._dbusservice.add_path("/Position", self._getShellyPosition())
-        self._dbusservice.add_path("/Serial", self._getShellySerial())
+        # Filled in from the poller thread's first /shelly lookup (see _poll_loop)
+        self._dbusservice.add_path("/Serial", None)
+        self._serial = None
+        self._serial_published = False
         self._dbusservice.add_path("/UpdateIndex", 0)
+        self._update_index = 0  # local mirror, avoids reading /UpdateIndex back
 
         # add path values to dbus
-        for path, settings in self._paths.items():
+        for path, initial, textformat in self._paths:
             self._dbusservice.add_path(
                 path,
-                settings["initial"],
-                gettextcallback=settings["textformat"],
+                initial,
+                gettextcallback=textformat,
                 writeable=True,
                 onchangecallback=self._handlechangedvalue,
             )
 
-        self._lastUpdate = 0
-        # Set up the main loop with a staggered start to avoid hammering the same Shelly when multiple devices share a host
+        self._lastUpdate = 0  # wall clock, for display only
+        self._lastUpdateMono = 0.0  # monotonic, for age calculations
+        # Last value written per D-Bus path, used to skip no-op writes
+        self._last_values = {}
+        # Set up the main loop with a staggered start to avoid hammering the same Shelly when multiple devices share a host.
+        # The host hash (stable across processes, unlike hash()) also spreads devices on different hosts.
         jitter_ms = (
-            (deviceinstance * 53 + self.channel_idx * 17) % REFRESH_INTERVAL_MS
+            (zlib.crc32(host.encode()) + deviceinstance * 53 + self.channel_idx * 17)
+            % self._refresh_ms
         ) or 50
-        gobject.timeout_add(jitter_ms, self._start_periodic)
-        gobject.timeout_add(self._getSignOfLifeInterval() * 60 * 1000, self._signOfLife)
+        # HTTP polling runs on a background thread so a slow Shelly never blocks
+        # the GLib main loop; each result (meter data or the exception raised
+        # while fetching) is handed to _update on the main loop via idle_add.
+        threading.Thread(
+            target=self._poll_loop,
+            args=(jitter_ms / 1000.0,),
+            name=f"poll-{dev_name}",
+            daemon=True,
+        ).start()
+        # SignOfLifeLog = 0 disables the periodic dump; a 0 ms timer would busy-loop.
+        # Second granularity lets GLib coalesce this wakeup with other timers.
+        if self._sign_of_life_minutes > 0:
+            gobject.timeout_add_seconds(self._sign_of_life_minutes * 60, self._signOfLife)
 
     # ----------------------
     # Config helpers
@@ -157,69 +268,65 @@ class DbusShellyEmService:
         value = self.global_cfg.get("SignOfLifeLog", "0").strip()
         return int(value or 0)
 
+    def _getRefreshInterval(self):
+        value = self.global_cfg.get("RefreshIntervalMs", "").strip()
+        value = int(value or REFRESH_INTERVAL_MS)
+        if value < MIN_REFRESH_INTERVAL_MS:
+            self.log.warning(
+                f"RefreshIntervalMs {value} is below {MIN_REFRESH_INTERVAL_MS}; using {MIN_REFRESH_INTERVAL_MS}"
+            )
+            return MIN_REFRESH_INTERVAL_MS
+        return value
+
     def _getShellyPosition(self):
         value = self.device_cfg.get("Position", "0").strip()
         return int(value or 0)
 
     def _getSelectedChannel(self):
-        try:
-            value = self.device_cfg.get("Channel", "0").strip()
-            channel = int(value or 0)
-        except Exception:
-            channel = 0
-        if channel not in (0, 1):
-            self.log.warning(f"Invalid Channel '{value}' in config; defaulting to 0")
-            channel = 0
-        return channel
+        value = self.device_cfg.get("Channel", "0").strip()
+        if not value:
+            return 0
+        # Accept everything int() did before (e.g. "01", "+1") without try/except
+        digits = value[1:] if value[:1] in "+-" else value
+        if digits.isdecimal() and int(value) in (0, 1):
+            return int(value)
+        self.log.warning(f"Invalid Channel '{value}' in config; defaulting to 0")
+        return 0
 
     # ----------------------
     # Shelly & DBus helpers
     # ----------------------
-    def _calc_current(self, power: float, reactive: float, voltage: float) -> float:
+    def _calc_current(self, p: float, q: float, v: float) -> float:
         """Compute RMS current from active power (W), reactive power (var) and voltage (V).
         Uses S = sqrt(P^2 + Q^2) to avoid division by pf≈0; I = S / V.
+        Inputs must already be floats (_update coerces them).
         Returns 0.0 if voltage ≤ 0 or inputs are not finite.
         """
-        try:
-            p = float(power or 0.0)
-            q = float(reactive or 0.0)
-            v = float(voltage or 0.0)
-        except Exception:
-            return 0.0
-        if not math.isfinite(p) or not math.isfinite(q) or not math.isfinite(v):
+        if not v > 0.0:  # also catches NaN
             return 0.0
-        if v <= 0.0:
-            return 0.0
-        S = math.hypot(p, q)  # sqrt(p*p + q*q)
-        return S / v
-
-    def _getShellyData(self):
-        URL = self.shelly_base + "/status"
-
-        def _do_get():
-            return self.session.get(
-                url=URL,
-                timeout=self._request_timeout,
-                auth=self.auth,
-                headers={"Accept": "application/json"},
-            )
+        # No overflow risk at meter magnitudes, so plain sqrt instead of hypot
+        i = math.sqrt(p * p + q * q) / v
+        return i if math.isfinite(i) else 0.0
 
-        try:
-            r = _do_get()
-        except requests.exceptions.ReadTimeout:
-            # one quick retry on read timeout
-            r = _do_get()
+    def _getShellyData(self, url: Optional[str] = None) -> dict:
+        URL = url or self._emeter_url
+
+        # Auth and headers live on the session; only the timeout is per call.
+        # No immediate retry here: _poll_loop backs off after failures.
+        r = self.session.get(URL, timeout=self._request_timeout)
 
         try:
             r.raise_for_status()
         except requests.HTTPError as e:
-            self.log.critical(
-                f"HTTP error from Shelly at {self.shelly_base}/status: {e}", exc_info=e
-            )
+            # Only a debug trace: a single failure is tolerated by _poll_loop,
+            # persistent ones are reported once by _update
+            self.log.debug(f"HTTP error from Shelly at {URL}: {e}")
             raise
 
+        # The payload is a few hundred bytes: decode it in one go. Streaming
+        # parsers (ijson & co.) only pay off for large documents and are slower here.
         try:
-            meter_data = r.json()
+            meter_data = json_loads(r.content)
         except ValueError as e:
             raise ValueError(f"Invalid JSON from Shelly at {URL}: {e}")
 
@@ -228,92 +335,159 @@ class DbusShellyEmService:
 
         return meter_data
 
-    def _getShellySerial(self):
-        meter_data = self._getShellyData()
-        if not meter_data.get("mac"):
+    def _getShellySerial(self) -> str:
+        info = self._getShellyData(self._info_url)
+        if not info.get("mac"):
             raise ValueError("Response does not contain 'mac' attribute")
-        return meter_data["mac"]
+        return info["mac"]
 
-    def _start_periodic(self):
-        # Register the periodic updater after an initial jitter delay
-        gobject.timeout_add(REFRESH_INTERVAL_MS, self._update)
-        return False  # one-shot
+    def _dbusBatch(self):
+        """Group D-Bus writes so velib emits one ItemsChanged signal on exit.
+        Falls back to plain per-path writes on velib_python versions without
+        context-manager support on VeDbusService.
+        """
+        if hasattr(self._dbusservice, "__enter__"):
+            return self._dbusservice
+        return nullcontext(self._dbusservice)
+
+    def _setIfChanged(
+        self, s, paths: tuple, value, epsilon: float = VALUE_EPSILON
+    ) -> None:
+        """Write value to every path in paths, but only if it differs from the last
+        value written to them (by more than epsilon for floats, by equality otherwise).
+        A change of type (e.g. int 0 -> float 0.0) always counts as a change, so the
+        D-Bus item type follows the value.
+        """
+        last = self._last_values.get(paths)
+        if paths not in self._last_values or type(last) is not type(value):
+            unchanged = False
+        elif isinstance(value, float):
+            unchanged = abs(last - value) <= epsilon
+        else:
+            unchanged = last == value
+        if unchanged:
+            return
+        for path in paths:
+            s[path] = value
+        self._last_values[paths] = value
+
+    def _poll_loop(self, initial_delay: float) -> None:
+        # Runs on the poller thread: no D-Bus access here.
+        # Ticks are scheduled against absolute monotonic deadlines so the period
+        # does not drift by the request duration.
+        interval = self._refresh_ms / 1000.0
+        next_tick = time.monotonic() + initial_delay
+        failures = 0
+        next_serial_try = 0.0
+        while True:
+            try:
+                time.sleep(max(0.0, next_tick - time.monotonic()))
+                # The serial is optional metadata: a failed lookup must never block
+                # the meter poll, it is just retried later
+                if self._serial is None and time.monotonic() >= next_serial_try:
+                    try:
+                        self._serial = self._getShellySerial()
+                    except Exception as e:
+                        next_serial_try = time.monotonic() + SERIAL_RETRY_SECONDS
+                        self.log.warning(
+                            f"Could not read serial from {self._info_url}; retrying in {SERIAL_RETRY_SECONDS}s: {e}"
+                        )
+                try:
+                    result = self._getShellyData()
+                except Exception as e:
+                    failures += 1
+                    if failures >= FAILURES_BEFORE_ZEROING:
+                        # Report persistent failures; _update zeroes the power values
+                        gobject.idle_add(self._update, e)
+                    # Back off (with jitter) before retrying instead of hammering an
+                    # unreachable or overloaded Shelly; the tick realignment below
+                    # restores the phase once a poll succeeds. The exponent is capped
+                    # before the float conversion: failures keeps counting during
+                    # long outages and 2 ** 1024 overflows a float
+                    backoff = 2 ** min(failures - 1, 5) * (0.5 + random.random())
+                    time.sleep(min(backoff, BACKOFF_MAX_SECONDS))
+                    continue
+                failures = 0
+                # idle_add is thread-safe; _update runs once on the main loop
+                gobject.idle_add(self._update, result)
+
+                next_tick += interval
+                now = time.monotonic()
+                if next_tick < now:
+                    # Skip ticks missed during a slow request instead of bursting,
+                    # keeping the original phase
+                    next_tick += ((now - next_tick) // interval + 1) * interval
+            except Exception:
+                # Never let an unexpected error end the thread: polling would
+                # stop for good while the process stays up
+                self.log.exception("Unexpected error in poller thread")
+                next_tick = time.monotonic() + interval
 
     def _signOfLife(self):
+        # Keep the timer alive but skip the D-Bus reads when INFO is filtered out
+        if not self.log.isEnabledFor(logging.INFO):
+            return True
         # Pretty-print last update timestamp with local time and age
+        self.log.info("--- Start: sign of life ---")
         if self._lastUpdate:
             dt = datetime.fromtimestamp(self._lastUpdate)
-            age = time.time() - self._lastUpdate
-            self.log.info("--- Start: sign of life ---")
+            age = time.monotonic() - self._lastUpdateMono
             self.log.info(
-                f"Last _update() call: {dt:%Y-%m-%d %H:%M:%S} ({int(age)}s ago)"
+                "Last _update() call: %s (%ds ago)", f"{dt:%Y-%m-%d %H:%M:%S}", age
             )
         else:
-            self.log.info("--- Start: sign of life ---")
             self.log.info("Last _update() call: never")
-        self.log.info(f"Last '/Ac/Power': {self._dbusservice['/Ac/Power']}")
-        self.log.info(f"Last '/Ac/Voltage': {self._dbusservice['/Ac/Voltage']}")
-        self.log.info(f"Last '/Ac/Current': {self._dbusservice['/Ac/Current']}")
-        self.log.info(
-            f"Last '/Ac/Energy/Forward': {self._dbusservice['/Ac/Energy/Forward']}"
-        )
-        self.log.info(
-            f"Last '/Ac/Energy/Reverse': {self._dbusservice['/Ac/Energy/Reverse']}"
-        )
+        for path in (
+            "/Ac/Power",
+            "/Ac/Voltage",
+            "/Ac/Current",
+            "/Ac/Energy/Forward",
+            "/Ac/Energy/Reverse",
+        ):
+            self.log.info("Last '%s': %s", path, self._dbusservice[path])
         self.log.info("--- End: sign of life ---")
         return True
 
-    def _update(self):
+    def _update(self, em) -> bool:
         try:
-            meter_data = self._getShellyData()
+            if isinstance(em, Exception):
+                raise em
             ch = self.channel_idx
-            em_list = meter_data.get("emeters", [])
-            if not isinstance(em_list, list) or len(em_list) <= ch:
-                raise ValueError(f"Shelly status has no emeters[{ch}]")
-            em = em_list[ch]
 
             # Bail out if Shelly marks this sample invalid
             if not bool(em.get("is_valid", True)):
                 self.log.warning(
                     f"Shelly channel {ch} reports is_valid=false; skipping update"
                 )
-                return True
+                return False
 
-            p = float(em.get("power", 0) or 0)
-            v = float(em.get("voltage", 0) or 0)
-            q = float(em.get("reactive", 0) or 0)
+            # float() is kept: Shelly may send integral values as JSON ints, and the
+            # D-Bus item type must stay Double across updates
+            p = float(em.get("power") or 0.0)
+            v = float(em.get("voltage") or 0.0)
+            q = float(em.get("reactive") or 0.0)
 
             # Shelly doesn't report current, so we calculate it
             i = self._calc_current(p, q, v)
 
-            total_kwh = float(em.get("total", 0) or 0) / 1000.0
-            total_returned_kwh = float(em.get("total_returned", 0) or 0) / 1000.0
-
-            # Send data to DBus
-            self._dbusservice["/Ac/Power"] = p
-            self._dbusservice["/Ac/Voltage"] = v
-            self._dbusservice["/Ac/Current"] = i
-
-            self._dbusservice["/Ac/L1/Power"] = p
-            self._dbusservice["/Ac/L1/Voltage"] = v
-            self._dbusservice["/Ac/L1/Current"] = i
+            total_kwh = float(em.get("total") or 0.0) * WH_TO_KWH
+            total_returned_kwh = float(em.get("total_returned") or 0.0) * WH_TO_KWH
 
-            self._dbusservice["/Ac/Energy/Forward"] = total_kwh
-            self._dbusservice["/Ac/Energy/Reverse"] = total_returned_kwh
+            self._apply_sample(p, v, i, total_kwh, total_returned_kwh)
+            if not self._serial_published and self._serial is not None:
+                self._dbusservice["/Serial"] = self._serial
+                self._serial_published = True
 
-            # Increment UpdateIndex - to show that new data is available, wraps at 256
-            self._dbusservice["/UpdateIndex"] = (
-                self._dbusservice["/UpdateIndex"] + 1
-            ) % 256
-
-            self.log.debug(f"Consumption (/Ac/Power): {p}")
-            self.log.debug(f"Voltage (/Ac/Voltage): {v}")
-            self.log.debug(f"Current (/Ac/Current): {i}")
-            self.log.debug(f"Forward (/Ac/Energy/Forward): {total_kwh}")
-            self.log.debug(f"Reverse (/Ac/Energy/Reverse): {total_returned_kwh}")
-            self.log.debug("---")
+            if self._debug_enabled:
+                self.log.debug("Consumption (/Ac/Power): %s", p)
+                self.log.debug("Voltage (/Ac/Voltage): %s", v)
+                self.log.debug("Current (/Ac/Current): %s", i)
+                self.log.debug("Forward (/Ac/Energy/Forward): %s", total_kwh)
+                self.log.debug("Reverse (/Ac/Energy/Reverse): %s", total_returned_kwh)
+                self.log.debug("---")
 
             self._lastUpdate = time.time()
+            self._lastUpdateMono = time.monotonic()
         except (
             ValueError,
             requests.exceptions.ConnectionError,
@@ -325,28 +499,55 @@ class DbusShellyEmService:
                 f"Setting power values to 0. Details: {e}",
                 exc_info=e,
             )
-            self._dbusservice["/Ac/L1/Power"] = 0
-            self._dbusservice["/Ac/Voltage"] = 0
-            self._dbusservice["/Ac/Current"] = 0
-            self._dbusservice["/Ac/L1/Voltage"] = 0
-            self._dbusservice["/Ac/L1/Current"] = 0
-            self._dbusservice["/Ac/Power"] = 0
-            self._dbusservice["/UpdateIndex"] = (
-                self._dbusservice["/UpdateIndex"] + 1
-            ) % 256
+            with self._dbusBatch() as s:
+                for paths, epsilon in SAMPLE_PATHS[:3]:  # power, voltage, current
+                    self._setIfChanged(s, paths, 0.0, epsilon)
+                self._update_index = (self._update_index + 1) & 0xFF
+                s["/UpdateIndex"] = self._update_index
         except Exception as e:
             self.log.critical("Unhandled exception in _update", exc_info=e)
-        # return true, otherwise add_timeout will be removed from GObject - see docs http://library.isr.ist.utl.pt/docs/pygtk2reference/gobject-functions.html#function-gobject--timeout-add
-        return True
+        # one-shot idle callback: return False so GLib removes it
+        return False
+
+    def _apply_sample(
+        self, p: float, v: float, i: float, total_kwh: float, total_returned_kwh: float
+    ) -> None:
+        # Send data to DBus; unchanged paths are skipped, UpdateIndex always moves
+        values = (p, v, i, total_kwh, total_returned_kwh)
+        with self._dbusBatch() as s:
+            for (paths, epsilon), value in zip(SAMPLE_PATHS, values):
+                self._setIfChanged(s, paths, value, epsilon)
+
+            # Increment UpdateIndex - to show that new data is available, wraps at 256
+            self._update_index = (self._update_index + 1) & 0xFF
+            s["/UpdateIndex"] = self._update_index
 
     def _handlechangedvalue(self, path, value):
         self.log.debug(f"someone else updated {path} to {value}")
+        # Forget cached values so the next poll republishes everything
+        self._last_values.clear()
         return True  # accept the change
 
 
-def load_config(path):
+@lru_cache(maxsize=4)
+def _parse_config(path, mtime_ns, size):
     cp = configparser.ConfigParser(inline_comment_prefixes=(";", "#"))
     cp.read(path)
+    return cp
+
+
+def read_config(path):
+    """Return the parsed INI file, only re-parsing it when its mtime or size changes."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        # missing file; ConfigParser.read() yields an empty config
+        return _parse_config(path, None, None)
+    return _parse_config(path, st.st_mtime_ns, st.st_size)
+
+
+def load_config(path):
+    cp = read_config(path)
     if not cp.has_section("global"):
         logging.critical("Missing [global] section in config")
         sys.exit(1)
@@ -358,9 +559,8 @@ def load_config(path):
     return cp["global"], devices
 
 
-def getLogLevel():
-    cp = configparser.ConfigParser(inline_comment_prefixes=(";", "#"))
-    cp.read(CONFIG_PATH)
+def getLogLevel(cp):
+    """Resolve [global] LogLevel from an already parsed config."""
     level_str = (
         cp["global"].get("LogLevel", "INFO") if cp.has_section("global") else "INFO"
     )
@@ -381,14 +581,15 @@ def getLogLevel():
     return logging.INFO
 
 
-def run_device(name, device_cfg, global_cfg):
+def run_device(name, device_cfg, global_cfg, log_level):
     """Spawned in a separate process to avoid D-Bus root object path ('/') conflicts.
     Each process creates its own VeDbusService and GLib main loop.
+    The log level is resolved once by the parent and passed in.
     """
     logging.basicConfig(
         format="%(asctime)s,%(msecs)d %(processName)s %(levelname)s %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
-        level=getLogLevel(),
+        level=log_level,
         handlers=[
             logging.FileHandler(LOG_FILE),
             logging.StreamHandler(),
@@ -400,11 +601,6 @@ def run_device(name, device_cfg, global_cfg):
 
     DBusGMainLoop(set_as_default=True)
 
-    _kwh = lambda p, v: (str(round(v, 2)) + " kWh")
-    _a = lambda p, v: (str(round(v, 1)) + " A")
-    _w = lambda p, v: (str(round(v, 1)) + " W")
-    _v = lambda p, v: (str(round(v, 1)) + " V")
-
     role = device_cfg.get("Role", "grid").strip().lower()
     logging.info(
         f"Starting device '{name}' (role={role}, instance={device_cfg.get('DeviceInstance')}, host={device_cfg.get('Host')})"
@@ -413,16 +609,7 @@ def run_device(name, device_cfg, global_cfg):
     svc = DbusShellyEmService(
         device_cfg=device_cfg,
         global_cfg=global_cfg,
-        paths={
-            "/Ac/Energy/Forward": {"initial": 0, "textformat": _kwh},
-            "/Ac/Energy/Reverse": {"initial": 0, "textformat": _kwh},
-            "/Ac/Power": {"initial": 0, "textformat": _w},
-            "/Ac/Current": {"initial": 0, "textformat": _a},
-            "/Ac/Voltage": {"initial": 0, "textformat": _v},
-            "/Ac/L1/Voltage": {"initial": 0, "textformat": _v},
-            "/Ac/L1/Current": {"initial": 0, "textformat": _a},
-            "/Ac/L1/Power": {"initial": 0, "textformat": _w},
-        },
+        paths=PATHS,
         dev_name=name,
     )
 
@@ -432,10 +619,12 @@ def run_device(name, device_cfg, global_cfg):
 
 
 def main():
+    # Parse config.ini once; load_config() below gets the same cached parser
+    log_level = getLogLevel(read_config(CONFIG_PATH))
     logging.basicConfig(
         format="%(asctime)s,%(msecs)d %(name)s %(levelname)s %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
-        level=getLogLevel(),
+        level=log_level,
         handlers=[
             logging.FileHandler(LOG_FILE),
             logging.StreamHandler(),
@@ -468,10 +657,13 @@ def main():
         # Spawn one process per device to avoid D-Bus root object ('/') conflicts
         procs = []
         for name, d in devices:
-            p = Process(target=run_device, args=(name, d, global_cfg), daemon=True)
+            p = Process(
+                target=run_device, args=(name, d, global_cfg, log_level), daemon=True
+            )
             p.start()
             procs.append(p)
             logging.info(f"Spawned process {p.name} (pid={p.pid}) for device '{name}'")
+            time.sleep(PROCESS_START_STAGGER_SECONDS)
 
         for p in procs:
             p.join()